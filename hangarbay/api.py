@@ -101,7 +101,13 @@ def _ensure_data():
         load_data(force=True, skip_age_check=True)
 
 
-def load_data(force: bool = False, skip_age_check: bool = False, quiet: bool = False) -> None:
+def load_data(
+    force: bool = False,
+    skip_age_check: bool = False,
+    quiet: bool = False,
+    threads: Optional[int] = None,
+    memory_limit: Optional[str] = None,
+) -> None:
     """Download and process FAA aircraft registry data.
     
     This function runs the complete pipeline: fetch -> normalize -> publish.
@@ -111,11 +117,14 @@ def load_data(force: bool = False, skip_age_check: bool = False, quiet: bool = F
         force: If True, re-download even if data exists
         skip_age_check: If True, skip warning about stale data
         quiet: If True, suppress progress output (useful for notebooks)
+        threads: DuckDB worker threads for each DuckDB instance the publish step opens (default: DuckDB's own)
+        memory_limit: DuckDB memory limit for each DuckDB instance the publish step opens, e.g. "8GB" (default: DuckDB's own)
     
     Example:
         >>> import hangarbay as hb
         >>> hb.load_data()
         >>> hb.load_data(quiet=True)  # For notebooks
+        >>> hb.load_data(memory_limit="4GB")  # On memory-constrained machines
     """
     data_dir = config.ensure_data_dir()
     
@@ -144,7 +153,7 @@ def load_data(force: bool = False, skip_age_check: bool = False, quiet: bool = F
     if not quiet:
         console.print("\n[bold]Step 3/3:[/bold] Building databases...")
     
-    publish.publish(data_dir, quiet=quiet)
+    publish.publish(data_dir, quiet=quiet, threads=threads, memory_limit=memory_limit)
     
     if not quiet:
         console.print("\n[green]✓ Setup complete! Ready to query.[/green]")
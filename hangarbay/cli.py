@@ -97,12 +97,14 @@ def normalize(
 @app.command()
 def publish(
     data_root: Path = typer.Option(Path("data"), help="Root data directory"),
+    threads: Optional[int] = typer.Option(None, min=1, help="DuckDB worker threads per DuckDB instance (default: DuckDB's own)"),
+    memory_limit: Optional[str] = typer.Option(None, help="DuckDB memory limit per DuckDB instance, e.g. 8GB (default: DuckDB's own)"),
 ):
     """Publish Parquet tables to DuckDB and SQLite FTS."""
     from pipelines.publish import publish as publish_pipeline
     
     try:
-        publish_dir = publish_pipeline(data_root=data_root)
+        publish_dir = publish_pipeline(data_root=data_root, threads=threads, memory_limit=memory_limit)
         console.print(f"[green]Publish complete: {publish_dir}[/green]")
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -112,6 +114,8 @@ def publish(
 @app.command()
 def update(
     data_root: Path = typer.Option(Path("data"), help="Root data directory"),
+    threads: Optional[int] = typer.Option(None, min=1, help="DuckDB worker threads per DuckDB instance (default: DuckDB's own)"),
+    memory_limit: Optional[str] = typer.Option(None, help="DuckDB memory limit per DuckDB instance, e.g. 8GB (default: DuckDB's own)"),
 ):
     """Update all data: fetch → normalize → publish (full pipeline)."""
     from pipelines.fetch import fetch as fetch_pipeline
@@ -133,7 +137,7 @@ def update(
         
         # Step 3: Publish
         console.print("[cyan]Step 3/3: Publishing to databases...[/cyan]")
-        publish_dir = publish_pipeline(data_root=data_root)
+        publish_dir = publish_pipeline(data_root=data_root, threads=threads, memory_limit=memory_limit)
         console.print(f"[green]✓ Publish complete[/green]\n")
         
         console.print("[bold green]✓ Update complete! Data is now current.[/bold green]")
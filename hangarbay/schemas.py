@@ -89,7 +89,7 @@ deregistrations_schema = pa.schema([
 owners_summary_schema = pa.schema([
     ("n_number", pa.string()),
     ("owner_count", pa.int32()),
-    ("owner_names_concat", pa.string()),
+    ("owner_names", pa.list_(pa.string())),
     ("any_trust_flag", pa.bool_()),
 ])
 
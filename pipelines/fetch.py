@@ -3,7 +3,7 @@
 import hashlib
 import json
 import zipfile
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 import requests
@@ -88,7 +88,7 @@ def create_manifest(
     
     manifest = {
         "snapshot_date": snapshot_date,
-        "created_at": datetime.utcnow().isoformat() + "Z",
+        "created_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "previous_snapshot": previous_snapshot,
         "files": files_info,
         "schema_hashes": get_all_schema_hashes(),
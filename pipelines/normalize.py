@@ -1,7 +1,7 @@
 """Normalize raw FAA files to typed Parquet tables."""
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -407,7 +407,7 @@ def normalize(
     # Write metadata
     metadata = {
         "snapshot_date": snapshot_date,
-        "normalized_at": datetime.utcnow().isoformat() + "Z",
+        "normalized_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "row_counts": {
             "aircraft": len(aircraft_table),
             "registrations": len(registrations_table),
@@ -1,12 +1,16 @@
 """Publish normalized tables to DuckDB and SQLite FTS."""
 
 import json
+import os
+import re
 import sqlite3
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 import duckdb
+import pyarrow as pa
 import pyarrow.parquet as pq
 from rich.console import Console
 
@@ -14,15 +18,78 @@ console = Console()
 # Global quiet flag
 _quiet = False
 
+# Owner fields copied into the SQLite search database, in table column order
+SQLITE_OWNER_COLUMNS = [
+    "owner_id", "n_number", "owner_name_std", "address_all_std",
+    "city_std", "state_std", "zip5",
+]
 
-def create_duckdb(publish_dir: Path, duckdb_path: Path) -> None:
+# Rows per Arrow record batch handed to executemany
+SQLITE_BATCH_SIZE = 20_000
+
+# Accepted DuckDB memory_limit values, e.g. "512MB", "8GB", "1.5GiB"
+MEMORY_LIMIT_PATTERN = re.compile(r"^\d+(\.\d+)?\s*[KMGT]i?B$", re.IGNORECASE)
+
+
+def _validate_memory_limit(memory_limit: Optional[str]) -> None:
+    """
+    Check a DuckDB memory limit before it is interpolated into SQL.
+    
+    Raises:
+        ValueError: If memory_limit is not a size such as "8GB"
+    """
+    if memory_limit and not MEMORY_LIMIT_PATTERN.fullmatch(memory_limit):
+        raise ValueError(f"Invalid memory limit {memory_limit!r}, expected a size such as '8GB'")
+
+
+def _validate_threads(threads: Optional[int]) -> None:
+    """
+    Check a DuckDB thread count before it is applied.
+    
+    Raises:
+        ValueError: If threads is less than 1
+    """
+    if threads is not None and threads < 1:
+        raise ValueError(f"Invalid thread count {threads!r}, expected at least 1")
+
+
+def _set_duckdb_limits(
+    conn: duckdb.DuckDBPyConnection,
+    threads: Optional[int],
+    memory_limit: Optional[str],
+) -> None:
+    """
+    Apply caller resource limits to a DuckDB connection (DuckDB's own defaults otherwise).
+    
+    Args:
+        conn: DuckDB connection to configure
+        threads: DuckDB worker threads, or None for DuckDB's default
+        memory_limit: DuckDB memory limit such as "8GB", or None for DuckDB's default
+    """
+    if threads is not None:
+        conn.execute(f"SET threads = {int(threads)}")
+    if memory_limit:
+        conn.execute(f"SET memory_limit = '{memory_limit}'")
+
+
+def create_duckdb(
+    publish_dir: Path,
+    duckdb_path: Path,
+    threads: Optional[int] = None,
+    memory_limit: Optional[str] = None,
+) -> None:
     """
     Load Parquet files into DuckDB database.
     
     Args:
         publish_dir: Directory containing Parquet files
         duckdb_path: Path for the DuckDB database file
+        threads: DuckDB worker threads (default: DuckDB's own)
+        memory_limit: DuckDB memory limit, e.g. "8GB" (default: DuckDB's own, 80% of RAM)
     """
+    _validate_threads(threads)
+    _validate_memory_limit(memory_limit)
+    
     if not _quiet: console.print(f"[cyan]Creating DuckDB at {duckdb_path}...[/cyan]")
     
     # Remove existing database
@@ -32,25 +99,44 @@ def create_duckdb(publish_dir: Path, duckdb_path: Path) -> None:
     # Connect to DuckDB
     conn = duckdb.connect(str(duckdb_path))
     
+    # Apply caller resource limits; insertion order doesn't matter for these
+    # tables, and dropping it lets CTAS and aggregates stream in parallel
+    _set_duckdb_limits(conn, threads, memory_limit)
+    conn.execute("SET preserve_insertion_order = false")
+    
     # Load each Parquet file as a table
     tables = ["aircraft", "registrations", "owners", "aircraft_make_model", "engines"]
     
+    parquet_files = {}
     for table_name in tables:
         parquet_file = publish_dir / f"{table_name}.parquet"
         if not parquet_file.exists():
             if not _quiet: console.print(f"[yellow]Warning: {parquet_file} not found, skipping[/yellow]")
             continue
-        
-        if not _quiet: console.print(f"[cyan]Loading {table_name}...[/cyan]")
-        
-        # Create table from Parquet
-        conn.execute(f"""
-            CREATE TABLE {table_name} AS 
-            SELECT * FROM read_parquet('{parquet_file}')
-        """)
-        
-        row_count = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
-        if not _quiet: console.print(f"[green]✓ Loaded {table_name}: {row_count:,} rows[/green]")
+        parquet_files[table_name] = parquet_file
+    
+    # The tables are independent, so scan their Parquet files concurrently,
+    # each on its own cursor (DuckDB cursors are separate connections to the same database)
+    if not _quiet: console.print(f"[cyan]Loading {', '.join(parquet_files)}...[/cyan]")
+    
+    def load_table(table_name: str) -> None:
+        cursor = conn.cursor()
+        try:
+            # table_name comes from the fixed list above; the path is bound as a parameter
+            cursor.execute(f"""
+                CREATE TABLE {table_name} AS 
+                SELECT * FROM read_parquet(?)
+            """, [str(parquet_files[table_name])])
+        finally:
+            cursor.close()
+    
+    if parquet_files:
+        with ThreadPoolExecutor(max_workers=len(parquet_files)) as executor:
+            # list() re-raises the first load error, if any
+            list(executor.map(load_table, parquet_files))
+    
+    # Row counts are reported from catalog statistics at the end
+    if not _quiet: console.print(f"[green]✓ Loaded {len(parquet_files)} tables[/green]")
     
     # Create owners_summary materialized view
     if not _quiet: console.print(f"[cyan]Creating owners_summary view...[/cyan]")
@@ -60,14 +146,13 @@ def create_duckdb(publish_dir: Path, duckdb_path: Path) -> None:
         SELECT 
             n_number,
             COUNT(*) as owner_count,
-            STRING_AGG(owner_name_std, '; ') as owner_names_concat,
+            LIST(owner_name_std ORDER BY owner_name_std) as owner_names,
             BOOL_OR(owner_type IN ('2', '4', '5')) as any_trust_flag
         FROM owners
         GROUP BY n_number
     """)
     
-    summary_count = conn.execute("SELECT COUNT(*) FROM owners_summary").fetchone()[0]
-    if not _quiet: console.print(f"[green]✓ Created owners_summary: {summary_count:,} rows[/green]")
+    if not _quiet: console.print("[green]✓ Created owners_summary[/green]")
     
     # Create reference/lookup tables for code decoding
     if not _quiet: console.print(f"[cyan]Creating reference tables...[/cyan]")
@@ -199,21 +284,18 @@ def create_duckdb(publish_dir: Path, duckdb_path: Path) -> None:
     
     if not _quiet: console.print(f"[green]✓ Created decoded views[/green]")
     
-    # Create some useful indexes
+    # Create indexes for point lookups by N-number (hangar search). Joins and
+    # scans use hash joins and zonemaps, so other columns aren't indexed.
     if not _quiet: console.print(f"[cyan]Creating indexes...[/cyan]")
     
-    # Index on n_number for fast lookups
     conn.execute("CREATE INDEX idx_aircraft_n_number ON aircraft(n_number)")
-    conn.execute("CREATE INDEX idx_registrations_n_number ON registrations(n_number)")
     conn.execute("CREATE INDEX idx_owners_n_number ON owners(n_number)")
-    conn.execute("CREATE INDEX idx_owners_summary_n_number ON owners_summary(n_number)")
-    
-    # Index on codes for joins
-    conn.execute("CREATE INDEX idx_aircraft_mfr_mdl_code ON aircraft(mfr_mdl_code)")
-    conn.execute("CREATE INDEX idx_aircraft_engine_code ON aircraft(engine_code)")
     
     if not _quiet: console.print(f"[green]✓ Created indexes[/green]")
     
+    # Refresh column statistics so the optimizer has accurate distinct counts for joins
+    conn.execute("ANALYZE")
+    
     # Show some stats
     if not _quiet: console.print(f"\n[cyan]Database statistics:[/cyan]")
     stats = conn.execute("""
@@ -228,32 +310,121 @@ def create_duckdb(publish_dir: Path, duckdb_path: Path) -> None:
     for table, count in stats:
         if not _quiet: console.print(f"  {table}: {count:,} rows")
     
+    # Merge the WAL into the database file so it ships self-contained
+    conn.execute("CHECKPOINT")
     conn.close()
     if not _quiet: console.print(f"[green]✓ DuckDB created: {duckdb_path}[/green]")
 
 
-def create_sqlite_fts(publish_dir: Path, sqlite_path: Path) -> None:
+def _load_owners_with_duckdb(
+    owners_parquet: Path,
+    sqlite_path: Path,
+    threads: Optional[int] = None,
+    memory_limit: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Copy owner search columns from Parquet into SQLite using DuckDB's sqlite extension.
+    
+    Rows go from DuckDB's Parquet reader to SQLite without passing through Python.
+    
+    Args:
+        owners_parquet: Path to owners.parquet
+        sqlite_path: Path to a SQLite database that already has an empty owners table
+        threads: DuckDB worker threads (default: DuckDB's own)
+        memory_limit: DuckDB memory limit, e.g. "8GB" (default: DuckDB's own)
+    
+    Returns:
+        Number of rows inserted, or None if the sqlite extension is unavailable
+    """
+    conn = duckdb.connect()
+    try:
+        _set_duckdb_limits(conn, threads, memory_limit)
+        
+        try:
+            conn.execute("INSTALL sqlite")
+            conn.execute("LOAD sqlite")
+        except duckdb.Error:
+            if not _quiet: console.print("[yellow]DuckDB sqlite extension unavailable, inserting from Python[/yellow]")
+            return None
+        
+        # ATTACH doesn't take parameters, so escape quotes in the path literal
+        sqlite_literal = str(sqlite_path).replace("'", "''")
+        conn.execute(f"ATTACH '{sqlite_literal}' AS owners_db (TYPE SQLITE)")
+        return conn.execute(f"""
+            INSERT INTO owners_db.owners
+            SELECT {', '.join(SQLITE_OWNER_COLUMNS)}
+            FROM read_parquet(?)
+        """, [str(owners_parquet)]).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _load_owners_with_adbc(owners_parquet: Path, sqlite_path: Path) -> Optional[int]:
+    """
+    Bulk-ingest owner search columns into SQLite with the ADBC SQLite driver.
+    
+    Record batches are streamed from Parquet and bound column-wise in C, so no
+    Python objects are created per cell. Requires the optional
+    ``adbc-driver-sqlite`` package (``pip install hangarbay[adbc]``).
+    
+    Args:
+        owners_parquet: Path to owners.parquet
+        sqlite_path: Path to a SQLite database that already has an empty owners table
+    
+    Returns:
+        Number of rows inserted, or None if adbc-driver-sqlite is not installed
+    """
+    try:
+        import adbc_driver_sqlite.dbapi as adbc_sqlite
+    except ImportError:
+        return None
+    
+    owners_file = pq.ParquetFile(owners_parquet, memory_map=True)
+    batches = owners_file.iter_batches(batch_size=SQLITE_BATCH_SIZE, columns=SQLITE_OWNER_COLUMNS)
+    schema = pa.schema([owners_file.schema_arrow.field(name) for name in SQLITE_OWNER_COLUMNS])
+    reader = pa.RecordBatchReader.from_batches(schema, batches)
+    
+    with adbc_sqlite.connect(str(sqlite_path)) as conn:
+        with conn.cursor() as cursor:
+            row_count = cursor.adbc_ingest("owners", reader, mode="append")
+        conn.commit()
+    
+    return row_count
+
+
+def create_sqlite_fts(
+    publish_dir: Path,
+    sqlite_path: Path,
+    threads: Optional[int] = None,
+    memory_limit: Optional[str] = None,
+) -> None:
     """
     Create SQLite database with FTS5 index for owner search.
     
     Args:
         publish_dir: Directory containing Parquet files
         sqlite_path: Path for the SQLite database file
+        threads: DuckDB worker threads for the owners copy (default: DuckDB's own)
+        memory_limit: DuckDB memory limit for the owners copy, e.g. "8GB" (default: DuckDB's own)
     """
+    _validate_threads(threads)
+    _validate_memory_limit(memory_limit)
+    
     if not _quiet: console.print(f"\n[cyan]Creating SQLite FTS at {sqlite_path}...[/cyan]")
     
     # Remove existing database
     if sqlite_path.exists():
         sqlite_path.unlink()
     
-    # Connect to SQLite
+    # Create owners table without a primary key. owner_id is a random xxhash64
+    # value, so as an INTEGER PRIMARY KEY each insert would land at a random
+    # point in the table B-tree; instead rows are appended and owner_id is
+    # indexed after the bulk load. The tradeoff: FTS5 content_rowid=owner_id
+    # lookups go through idx_owners_owner_id rather than the rowid.
     conn = sqlite3.connect(str(sqlite_path))
-    cursor = conn.cursor()
-    
-    # Create owners table
-    cursor.execute("""
+    conn.execute("""
         CREATE TABLE owners (
-            owner_id INTEGER PRIMARY KEY,
+            owner_id INTEGER NOT NULL,
             n_number TEXT NOT NULL,
             owner_name_std TEXT,
             address_all_std TEXT,
@@ -262,25 +433,56 @@ def create_sqlite_fts(publish_dir: Path, sqlite_path: Path) -> None:
             zip5 TEXT
         )
     """)
+    conn.commit()
+    conn.close()
     
-    # Read owners from Parquet
+    # Copy owners straight from Parquet with DuckDB when its sqlite extension is
+    # available, otherwise with the ADBC driver if it is installed
     if not _quiet: console.print("[cyan]Loading owners data...[/cyan]")
-    owners_table = pq.read_table(publish_dir / "owners.parquet")
-    owners_df = owners_table.to_pandas()
-    
-    # Insert into SQLite (just the fields we need for search)
-    owners_data = owners_df[[
-        'owner_id', 'n_number', 'owner_name_std', 'address_all_std',
-        'city_std', 'state_std', 'zip5'
-    ]].values.tolist()
+    owners_parquet = publish_dir / "owners.parquet"
+    row_count = _load_owners_with_duckdb(owners_parquet, sqlite_path, threads, memory_limit)
+    if row_count is None:
+        row_count = _load_owners_with_adbc(owners_parquet, sqlite_path)
     
-    cursor.executemany("""
-        INSERT INTO owners VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, owners_data)
+    # Connect to SQLite (autocommit mode so we control the transaction explicitly)
+    conn = sqlite3.connect(str(sqlite_path), isolation_level=None)
+    cursor = conn.cursor()
     
-    if not _quiet: console.print(f"[green]✓ Inserted {len(owners_data):,} owner records[/green]")
+    # Tune for a one-shot bulk build: WAL, relaxed fsync, large in-memory cache
+    cursor.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-262144;
+        PRAGMA mmap_size=30000000000;
+        PRAGMA locking_mode=EXCLUSIVE;
+    """)
     
-    # Create FTS5 virtual table
+    # Load, index, and build FTS in a single transaction
+    cursor.execute("BEGIN IMMEDIATE")
+    
+    if row_count is None:
+        # Fall back to streaming Arrow record batches through executemany,
+        # reading the Parquet file incrementally so only one batch is in memory
+        row_count = 0
+        owners_file = pq.ParquetFile(owners_parquet, memory_map=True)
+        for batch in owners_file.iter_batches(batch_size=SQLITE_BATCH_SIZE, columns=SQLITE_OWNER_COLUMNS):
+            rows = zip(*(column.to_pylist() for column in batch.columns))
+            cursor.executemany("""
+                INSERT INTO owners VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            row_count += batch.num_rows
+    
+    if not _quiet: console.print(f"[green]✓ Inserted {row_count:,} owner records[/green]")
+    
+    # FTS5 looks up external content rows by owner_id
+    cursor.execute("CREATE UNIQUE INDEX idx_owners_owner_id ON owners(owner_id)")
+    
+    # Create FTS5 virtual table (diacritic-folding tokenizer, prebuilt prefix
+    # indexes so type-ahead queries like 'SMI*' don't scan every posting list).
+    # detail=none and columnsize=0 drop token positions and per-row sizes:
+    # the index is much smaller, but phrase, NEAR and column-filter queries
+    # aren't supported.
     if not _quiet: console.print("[cyan]Creating FTS5 index...[/cyan]")
     
     cursor.execute("""
@@ -290,16 +492,20 @@ def create_sqlite_fts(publish_dir: Path, sqlite_path: Path) -> None:
             city_std,
             state_std,
             content=owners,
-            content_rowid=owner_id
+            content_rowid=owner_id,
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3 4',
+            columnsize=0,
+            detail=none
         )
     """)
     
-    # Populate FTS index
-    cursor.execute("""
-        INSERT INTO owners_fts(owner_name_std, address_all_std, city_std, state_std)
-        SELECT owner_name_std, address_all_std, city_std, state_std
-        FROM owners
-    """)
+    # Populate FTS index from the content table (keeps rowids aligned with owner_id)
+    cursor.execute("INSERT INTO owners_fts(owners_fts) VALUES('rebuild')")
+    
+    # Merge the segments written during rebuild into a single b-tree so each
+    # query term reads one posting list
+    cursor.execute("INSERT INTO owners_fts(owners_fts) VALUES('optimize')")
     
     if not _quiet: console.print(f"[green]✓ Created FTS5 index[/green]")
     
@@ -307,8 +513,21 @@ def create_sqlite_fts(publish_dir: Path, sqlite_path: Path) -> None:
     cursor.execute("CREATE INDEX idx_owners_n_number ON owners(n_number)")
     cursor.execute("CREATE INDEX idx_owners_state ON owners(state_std)")
     
-    conn.commit()
+    cursor.execute("COMMIT")
+    
+    # Checkpoint the WAL and ship the file in rollback-journal mode so
+    # readers don't need write access for -wal/-shm files
+    cursor.execute("PRAGMA journal_mode=DELETE")
+    
+    # Write a compacted copy (no free pages, tables laid out contiguously)
+    # and swap it in place of the build file
+    if not _quiet: console.print("[cyan]Compacting SQLite database...[/cyan]")
+    compact_path = sqlite_path.with_name(sqlite_path.name + ".tmp")
+    if compact_path.exists():
+        compact_path.unlink()
+    cursor.execute("VACUUM INTO ?", [str(compact_path)])
     conn.close()
+    os.replace(compact_path, sqlite_path)
     
     if not _quiet: console.print(f"[green]✓ SQLite FTS created: {sqlite_path}[/green]")
 
@@ -388,7 +607,7 @@ def _create_consolidated_metadata(
         "source_urls": source_urls,  # List of source URLs
         "file_hashes": file_hashes,  # SHA256 hashes of downloaded files
         "normalized_at": normalize_meta.get("normalized_at", ""),  # UTC timestamp from normalize
-        "published_at": datetime.utcnow().isoformat() + "Z",  # UTC timestamp from publish
+        "published_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),  # UTC timestamp from publish
         "row_counts": normalize_meta.get("row_counts", {}),  # Row counts per table
         "schema_hashes": raw_manifest.get("schema_hashes", {}),  # Schema version hashes
         "databases": {
@@ -411,6 +630,8 @@ def publish(
     data_root: Path = Path("data"),
     snapshot_date: Optional[str] = None,
     quiet: bool = False,
+    threads: Optional[int] = None,
+    memory_limit: Optional[str] = None,
 ) -> Path:
     """
     Publish normalized Parquet to DuckDB and SQLite FTS.
@@ -418,6 +639,10 @@ def publish(
     Args:
         data_root: Root data directory
         snapshot_date: Snapshot date (for metadata)
+        threads: DuckDB worker threads, applied to each DuckDB instance the
+            registry and SQLite builds open (default: DuckDB's own)
+        memory_limit: DuckDB memory limit, e.g. "8GB", applied to each DuckDB
+            instance the registry and SQLite builds open (default: DuckDB's own)
     
     Returns:
         Path to publish directory
@@ -426,19 +651,30 @@ def publish(
     _quiet = quiet
     publish_dir = data_root / "publish"
     
+    # Fail before starting either build rather than after the SQLite one
+    _validate_threads(threads)
+    _validate_memory_limit(memory_limit)
+    
     if not publish_dir.exists() or not (publish_dir / "aircraft.parquet").exists():
         if not _quiet: console.print("[red]No normalized data found. Run 'hangar normalize' first.[/red]")
         raise FileNotFoundError("No Parquet files found in publish directory")
     
     if not _quiet: console.print(f"\n[bold cyan]Publishing data from {publish_dir}[/bold cyan]\n")
     
-    # Create DuckDB
+    # Create DuckDB and SQLite FTS concurrently: both only read the Parquet
+    # files and write separate databases. Threads are enough because DuckDB
+    # and sqlite3 release the GIL while executing statements, and unlike
+    # worker processes they don't re-import the caller's __main__ script.
+    # Progress lines from the two builds may interleave.
     duckdb_path = publish_dir / "registry.duckdb"
-    create_duckdb(publish_dir, duckdb_path)
-    
-    # Create SQLite FTS
     sqlite_path = publish_dir / "owners.sqlite"
-    create_sqlite_fts(publish_dir, sqlite_path)
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        duckdb_future = executor.submit(create_duckdb, publish_dir, duckdb_path, threads, memory_limit)
+        sqlite_future = executor.submit(create_sqlite_fts, publish_dir, sqlite_path, threads, memory_limit)
+        # Wait for both; result() re-raises any worker error
+        duckdb_future.result()
+        sqlite_future.result()
     
     # Write metadata
     if not _quiet: console.print(f"\n[cyan]Writing publish metadata...[/cyan]")
@@ -454,7 +690,7 @@ def publish(
     # Write publish.json (individual step metadata)
     publish_metadata = {
         "snapshot_date": snapshot_date,
-        "published_at": datetime.utcnow().isoformat() + "Z",
+        "published_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "duckdb_path": str(duckdb_path.name),
         "sqlite_path": str(sqlite_path.name),
         "duckdb_size_mb": round(duckdb_path.stat().st_size / 1024 / 1024, 2),
@@ -0,0 +1,15 @@
+"""Test the public Python API."""
+
+from hangarbay import api
+
+
+def test_load_data_passes_resource_limits_to_publish(monkeypatch, tmp_path):
+    publish_calls = []
+    monkeypatch.setattr(api.config, "ensure_data_dir", lambda: tmp_path)
+    monkeypatch.setattr(api.fetch, "fetch", lambda *args, **kwargs: None)
+    monkeypatch.setattr(api.normalize, "normalize", lambda *args, **kwargs: None)
+    monkeypatch.setattr(api.publish, "publish", lambda *args, **kwargs: publish_calls.append((args, kwargs)))
+
+    api.load_data(force=True, quiet=True, threads=2, memory_limit="4GB")
+
+    assert publish_calls == [((tmp_path,), {"quiet": True, "threads": 2, "memory_limit": "4GB"})]
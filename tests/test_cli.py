@@ -0,0 +1,55 @@
+"""Test CLI option handling."""
+
+import pytest
+from typer.testing import CliRunner
+
+import pipelines.fetch
+import pipelines.normalize
+import pipelines.publish
+from hangarbay.cli import app
+
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def publish_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(pipelines.publish, "publish", lambda **kwargs: calls.append(kwargs))
+    return calls
+
+
+def test_publish_passes_resource_limits(publish_calls, tmp_path):
+    result = runner.invoke(app, [
+        "publish", "--data-root", str(tmp_path), "--threads", "4", "--memory-limit", "4GB",
+    ])
+
+    assert result.exit_code == 0
+    assert publish_calls == [{"data_root": tmp_path, "threads": 4, "memory_limit": "4GB"}]
+
+
+def test_publish_defaults_resource_limits_to_none(publish_calls, tmp_path):
+    result = runner.invoke(app, ["publish", "--data-root", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert publish_calls == [{"data_root": tmp_path, "threads": None, "memory_limit": None}]
+
+
+def test_update_passes_resource_limits(publish_calls, monkeypatch, tmp_path):
+    monkeypatch.setattr(pipelines.fetch, "fetch", lambda **kwargs: tmp_path)
+    monkeypatch.setattr(pipelines.normalize, "normalize", lambda **kwargs: tmp_path)
+
+    result = runner.invoke(app, [
+        "update", "--data-root", str(tmp_path), "--threads", "2", "--memory-limit", "512MB",
+    ])
+
+    assert result.exit_code == 0
+    assert publish_calls == [{"data_root": tmp_path, "threads": 2, "memory_limit": "512MB"}]
+
+
+@pytest.mark.parametrize("command", ["publish", "update"])
+def test_threads_must_be_positive(publish_calls, command):
+    result = runner.invoke(app, [command, "--threads", "0"])
+
+    assert result.exit_code != 0
+    assert publish_calls == []
@@ -51,6 +51,8 @@ def test_create_consolidated_metadata_success(tmp_path):
     assert result["source_urls"] == ["http://example.com/file1"]
     assert "file1" in result["file_hashes"]
     assert result["databases"]["duckdb"]["path"] == duckdb_path.name
+    assert result["published_at"].endswith("Z")
+    assert "+00:00" not in result["published_at"]
 
 
 def test_create_consolidated_metadata_missing_files(tmp_path):
@@ -0,0 +1,355 @@
+"""Test publishing normalized Parquet to DuckDB and SQLite."""
+
+import json
+import sqlite3
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from hangarbay.schemas import (
+    aircraft_make_model_schema,
+    aircraft_schema,
+    engines_schema,
+    owners_schema,
+    registrations_schema,
+)
+from pipelines import publish as publish_module
+from pipelines.publish import create_duckdb, create_sqlite_fts, publish
+
+
+OWNERS = [
+    {
+        "owner_id": 101,
+        "n_number": "12345",
+        "owner_type": "1",
+        "owner_name_std": "SMITH JOHN",
+        "address_all_std": "100 MAIN ST",
+        "city_std": "AUSTIN",
+        "state_std": "TX",
+        "zip5": "78701",
+    },
+    {
+        "owner_id": 202,
+        "n_number": "678AB",
+        "owner_type": "3",
+        "owner_name_std": "ACME AVIATION LLC",
+        "address_all_std": "5 HANGAR RD",
+        "city_std": "DENVER",
+        "state_std": "CO",
+        "zip5": "80202",
+    },
+    {
+        "owner_id": 303,
+        "n_number": "678AB",
+        "owner_type": "4",
+        "owner_name_std": "DOE JANE",
+        "address_all_std": "5 HANGAR RD",
+        "city_std": "DENVER",
+        "state_std": "CO",
+        "zip5": "80202",
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def quiet_publish(monkeypatch):
+    monkeypatch.setattr(publish_module, "_quiet", True)
+
+
+class RecordingConnection:
+    """DuckDB connection wrapper that records executed statements."""
+
+    def __init__(self, conn, statements):
+        self._conn = conn
+        self._statements = statements
+
+    def execute(self, query, *args):
+        self._statements.append(" ".join(query.split()))
+        return self._conn.execute(query, *args)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+@pytest.fixture
+def duckdb_statements(monkeypatch):
+    statements = []
+    connect = duckdb.connect
+    monkeypatch.setattr(
+        publish_module.duckdb, "connect",
+        lambda *args, **kwargs: RecordingConnection(connect(*args, **kwargs), statements),
+    )
+    return statements
+
+
+@pytest.fixture
+def publish_dir(tmp_path):
+    publish_dir = tmp_path / "publish"
+    publish_dir.mkdir()
+    pq.write_table(pa.Table.from_pylist(OWNERS, schema=owners_schema), publish_dir / "owners.parquet")
+    pq.write_table(
+        pa.Table.from_pylist([{"n_number": n, "mfr_mdl_code": "05630K1", "reg_status": "V"} for n in ("12345", "678AB")], schema=aircraft_schema),
+        publish_dir / "aircraft.parquet",
+    )
+    pq.write_table(
+        pa.Table.from_pylist([{"n_number": n, "reg_status": "V"} for n in ("12345", "678AB")], schema=registrations_schema),
+        publish_dir / "registrations.parquet",
+    )
+    pq.write_table(
+        pa.Table.from_pylist([{"mfr_mdl_code": "05630K1", "maker": "CESSNA", "model": "172S"}], schema=aircraft_make_model_schema),
+        publish_dir / "aircraft_make_model.parquet",
+    )
+    pq.write_table(
+        pa.Table.from_pylist([{"engine_code": "41514", "manufacturer": "LYCOMING"}], schema=engines_schema),
+        publish_dir / "engines.parquet",
+    )
+    return publish_dir
+
+
+def test_create_duckdb_loads_tables_and_views(publish_dir):
+    duckdb_path = publish_dir / "registry.duckdb"
+    create_duckdb(publish_dir, duckdb_path)
+
+    conn = duckdb.connect(str(duckdb_path), read_only=True)
+    owner_count = conn.execute("SELECT COUNT(*) FROM owners").fetchone()[0]
+    maker = conn.execute("SELECT maker FROM aircraft_decoded WHERE n_number = '12345'").fetchone()[0]
+    summary = conn.execute("SELECT owner_count, any_trust_flag FROM owners_summary WHERE n_number = '678AB'").fetchone()
+    conn.close()
+
+    assert owner_count == len(OWNERS)
+    assert maker == "CESSNA"
+    assert summary == (2, True)
+
+
+def test_create_duckdb_handles_quotes_in_path(publish_dir):
+    quoted_dir = publish_dir.rename(publish_dir.with_name("owner's publish"))
+    duckdb_path = quoted_dir / "registry.duckdb"
+    create_duckdb(quoted_dir, duckdb_path)
+
+    conn = duckdb.connect(str(duckdb_path), read_only=True)
+    owner_count = conn.execute("SELECT COUNT(*) FROM owners").fetchone()[0]
+    conn.close()
+
+    assert owner_count == len(OWNERS)
+
+
+def test_create_duckdb_applies_resource_limits(publish_dir, duckdb_statements):
+    duckdb_path = publish_dir / "registry.duckdb"
+    create_duckdb(publish_dir, duckdb_path, threads=2, memory_limit="512MB")
+
+    assert "SET threads = 2" in duckdb_statements
+    assert "SET memory_limit = '512MB'" in duckdb_statements
+
+    conn = duckdb.connect(str(duckdb_path), read_only=True)
+    owner_count = conn.execute("SELECT COUNT(*) FROM owners").fetchone()[0]
+    conn.close()
+
+    assert owner_count == len(OWNERS)
+
+
+def test_create_duckdb_keeps_duckdb_defaults_without_limits(publish_dir, duckdb_statements):
+    create_duckdb(publish_dir, publish_dir / "registry.duckdb")
+
+    assert not any(statement.startswith(("SET threads", "SET memory_limit")) for statement in duckdb_statements)
+
+
+def test_publish_passes_resource_limits_to_both_builds(publish_dir, monkeypatch):
+    calls = []
+    monkeypatch.setattr(publish_module, "create_duckdb", lambda *args: calls.append(("duckdb", args[2:])))
+    monkeypatch.setattr(publish_module, "create_sqlite_fts", lambda *args: calls.append(("sqlite", args[2:])))
+    monkeypatch.setattr(publish_module, "_create_consolidated_metadata", lambda **kwargs: {})
+    for name in ("registry.duckdb", "owners.sqlite"):
+        (publish_dir / name).write_bytes(b"")
+
+    publish(data_root=publish_dir.parent, snapshot_date="2026-01-01", quiet=True, threads=3, memory_limit="1GB")
+
+    assert sorted(calls) == [("duckdb", (3, "1GB")), ("sqlite", (3, "1GB"))]
+
+
+@pytest.mark.parametrize("memory_limit", ["8", "lots", "1GB'; DROP TABLE owners; --"])
+def test_create_duckdb_rejects_invalid_memory_limit(publish_dir, memory_limit):
+    with pytest.raises(ValueError):
+        create_duckdb(publish_dir, publish_dir / "registry.duckdb", memory_limit=memory_limit)
+
+
+@pytest.mark.parametrize("threads", [0, -1])
+def test_create_duckdb_rejects_invalid_threads(publish_dir, threads):
+    with pytest.raises(ValueError):
+        create_duckdb(publish_dir, publish_dir / "registry.duckdb", threads=threads)
+
+
+def test_create_duckdb_owner_names_are_sorted(publish_dir):
+    duckdb_path = publish_dir / "registry.duckdb"
+    create_duckdb(publish_dir, duckdb_path)
+
+    conn = duckdb.connect(str(duckdb_path), read_only=True)
+    names = conn.execute("SELECT owner_names FROM owners_summary WHERE n_number = '678AB'").fetchone()[0]
+    conn.close()
+
+    assert names == ["ACME AVIATION LLC", "DOE JANE"]
+
+
+def test_create_sqlite_fts_loads_owners(publish_dir):
+    sqlite_path = publish_dir / "owners.sqlite"
+    create_sqlite_fts(publish_dir, sqlite_path)
+
+    conn = sqlite3.connect(str(sqlite_path))
+    rows = conn.execute("SELECT * FROM owners ORDER BY owner_id").fetchall()
+    conn.close()
+
+    assert rows == [
+        (101, "12345", "SMITH JOHN", "100 MAIN ST", "AUSTIN", "TX", "78701"),
+        (202, "678AB", "ACME AVIATION LLC", "5 HANGAR RD", "DENVER", "CO", "80202"),
+        (303, "678AB", "DOE JANE", "5 HANGAR RD", "DENVER", "CO", "80202"),
+    ]
+
+
+def test_create_sqlite_fts_streams_in_batches_without_bulk_loaders(publish_dir, monkeypatch):
+    monkeypatch.setattr(publish_module, "_load_owners_with_duckdb", lambda *args: None)
+    monkeypatch.setattr(publish_module, "_load_owners_with_adbc", lambda *args: None)
+    monkeypatch.setattr(publish_module, "SQLITE_BATCH_SIZE", 2)
+    sqlite_path = publish_dir / "owners.sqlite"
+    create_sqlite_fts(publish_dir, sqlite_path)
+
+    conn = sqlite3.connect(str(sqlite_path))
+    count = conn.execute("SELECT COUNT(*) FROM owners").fetchone()[0]
+    conn.close()
+
+    assert count == len(OWNERS)
+
+
+def test_create_sqlite_fts_with_adbc(publish_dir, monkeypatch):
+    pytest.importorskip("adbc_driver_sqlite")
+    monkeypatch.setattr(publish_module, "_load_owners_with_duckdb", lambda *args: None)
+    monkeypatch.setattr(publish_module, "SQLITE_BATCH_SIZE", 2)
+    sqlite_path = publish_dir / "owners.sqlite"
+    create_sqlite_fts(publish_dir, sqlite_path)
+
+    conn = sqlite3.connect(str(sqlite_path))
+    rows = conn.execute("SELECT owner_id, typeof(owner_id), n_number FROM owners ORDER BY owner_id").fetchall()
+    conn.close()
+
+    assert rows == [(101, "integer", "12345"), (202, "integer", "678AB"), (303, "integer", "678AB")]
+
+
+def test_create_sqlite_fts_with_duckdb_sqlite_extension(publish_dir, monkeypatch):
+    conn = duckdb.connect()
+    try:
+        conn.execute("INSTALL sqlite")
+        conn.execute("LOAD sqlite")
+    except duckdb.Error:
+        pytest.skip("DuckDB sqlite extension unavailable")
+    finally:
+        conn.close()
+
+    row_counts = []
+    load_owners_with_duckdb = publish_module._load_owners_with_duckdb
+
+    def record_row_count(*args):
+        row_count = load_owners_with_duckdb(*args)
+        row_counts.append(row_count)
+        return row_count
+
+    monkeypatch.setattr(publish_module, "_load_owners_with_duckdb", record_row_count)
+    sqlite_path = publish_dir / "owners.sqlite"
+    create_sqlite_fts(publish_dir, sqlite_path)
+
+    conn = sqlite3.connect(str(sqlite_path))
+    rows = conn.execute("SELECT *, typeof(owner_id) FROM owners ORDER BY owner_id").fetchall()
+    matches = conn.execute("SELECT rowid FROM owners_fts WHERE owners_fts MATCH 'acme'").fetchall()
+    conn.close()
+
+    assert row_counts == [len(OWNERS)]
+    assert rows == [
+        (101, "12345", "SMITH JOHN", "100 MAIN ST", "AUSTIN", "TX", "78701", "integer"),
+        (202, "678AB", "ACME AVIATION LLC", "5 HANGAR RD", "DENVER", "CO", "80202", "integer"),
+        (303, "678AB", "DOE JANE", "5 HANGAR RD", "DENVER", "CO", "80202", "integer"),
+    ]
+    assert matches == [(202,)]
+
+
+def test_create_sqlite_fts_applies_resource_limits_to_duckdb(publish_dir, duckdb_statements):
+    create_sqlite_fts(publish_dir, publish_dir / "owners.sqlite", threads=2, memory_limit="512MB")
+
+    assert "SET threads = 2" in duckdb_statements
+    assert "SET memory_limit = '512MB'" in duckdb_statements
+
+
+def test_create_sqlite_fts_ships_compacted_without_wal(publish_dir):
+    sqlite_path = publish_dir / "owners.sqlite"
+    create_sqlite_fts(publish_dir, sqlite_path)
+
+    assert not (publish_dir / "owners.sqlite-wal").exists()
+    assert not (publish_dir / "owners.sqlite.tmp").exists()
+    conn = sqlite3.connect(str(sqlite_path))
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    conn.execute("INSERT INTO owners_fts(owners_fts) VALUES('integrity-check')")
+    conn.close()
+
+    assert journal_mode == "delete"
+    assert freelist_count == 0
+
+
+def test_create_sqlite_fts_indexes_owner_id(publish_dir):
+    sqlite_path = publish_dir / "owners.sqlite"
+    create_sqlite_fts(publish_dir, sqlite_path)
+
+    conn = sqlite3.connect(str(sqlite_path))
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute("INSERT INTO owners (owner_id, n_number) VALUES (101, '99999')")
+    conn.close()
+
+
+def test_create_sqlite_fts_rowids_match_owner_id(publish_dir):
+    sqlite_path = publish_dir / "owners.sqlite"
+    create_sqlite_fts(publish_dir, sqlite_path)
+
+    conn = sqlite3.connect(str(sqlite_path))
+    rows = conn.execute("""
+        SELECT o.owner_id, o.owner_name_std
+        FROM owners_fts f
+        JOIN owners o ON o.owner_id = f.rowid
+        WHERE owners_fts MATCH 'acme'
+    """).fetchall()
+    conn.close()
+
+    assert rows == [(202, "ACME AVIATION LLC")]
+
+
+def test_create_sqlite_fts_supports_prefix_queries(publish_dir):
+    sqlite_path = publish_dir / "owners.sqlite"
+    create_sqlite_fts(publish_dir, sqlite_path)
+
+    conn = sqlite3.connect(str(sqlite_path))
+    rowids = conn.execute(
+        "SELECT rowid FROM owners_fts WHERE owners_fts MATCH 'hang*' ORDER BY rowid"
+    ).fetchall()
+    conn.close()
+
+    assert rowids == [(202,), (303,)]
+
+
+def test_publish_builds_both_databases(publish_dir):
+    data_root = publish_dir.parent
+    snapshot_date = "2026-01-01"
+    meta_dir = publish_dir / "_meta"
+    meta_dir.mkdir()
+    (meta_dir / "normalize.json").write_text(json.dumps({
+        "snapshot_date": snapshot_date,
+        "normalized_at": "2026-01-01T00:00:00Z",
+        "row_counts": {"owners": len(OWNERS)},
+    }))
+    raw_dir = data_root / "raw" / snapshot_date
+    raw_dir.mkdir(parents=True)
+    (raw_dir / "manifest.json").write_text(json.dumps({"created_at": "2026-01-01T00:00:00Z", "files": {}}))
+
+    publish(data_root=data_root, quiet=True)
+
+    assert (publish_dir / "registry.duckdb").exists()
+    assert (publish_dir / "owners.sqlite").exists()
+    metadata = json.loads((meta_dir / "metadata.json").read_text())
+    assert metadata["snapshot_date"] == snapshot_date
+    assert metadata["databases"]["sqlite"]["size_mb"] >= 0